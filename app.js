@@ -13,7 +13,7 @@ class FOSDEMBrowser {
         this.init();
     }
 
-                        init() {
+    init() {
         // Load events from embedded data (no server needed!)
         // Show loading state immediately
         const container = document.getElementById('eventsList');
@@ -65,18 +65,6 @@ class FOSDEMBrowser {
         }
     }
 
-
-
-
-
-
-
-
-
-
-
-
-
     loadFavorites() {
         try {
             const stored = localStorage.getItem('fosdem-favorites');
@@ -2,11 +2,54 @@
 """
 Embed events.json into app.js to create a standalone version
 that works without a server (file:// protocol)
+
+If orjson is installed it is used for faster JSON parsing and serialization.
 """
 
+import gzip
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(text):
+    """Parse a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def json_dumps(obj):
+    """Serialize obj to a compact (whitespace-free) JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+def write_file_atomic(path, payload):
+    """Write bytes to path via a temporary file, so a crash never leaves it half-written"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def write_file_if_changed(path, payload):
+    """Write bytes to path unless it already has exactly this content; return True if written
+
+    Skipping identical writes keeps file watchers, dev servers and git from
+    reacting to re-runs that produced nothing new.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == payload:
+                print(f"{path} unchanged, skipping write")
+                return False
+    except FileNotFoundError:
+        pass
+    write_file_atomic(path, payload)
+    return True
+
 print("Creating standalone version...")
 
 # Read events.json
@@ -15,7 +58,7 @@ if not os.path.exists('events.json'):
     exit(1)
 
 with open('events.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+    data = json_loads(f.read())
 
 # Handle both old format (array) and new format (object with metadata)
 if isinstance(data, list):
@@ -40,6 +83,7 @@ with open('app.js', 'r', encoding='utf-8') as f:
 import re
 
 # Create embedded version - use JSON.parse for faster loading
+# The JSON is minified, which keeps index.html small
 # Store JSON in a script tag in HTML for cleaner separation
 # Include metadata (scrapedAt) if available
 data_to_embed = {
@@ -47,7 +91,7 @@ data_to_embed = {
 }
 if scraped_at:
     data_to_embed['scrapedAt'] = scraped_at
-events_json = json.dumps(data_to_embed, ensure_ascii=False)
+events_json = json_dumps(data_to_embed)
 # Escape </script> to prevent breaking out of script tag (JSON injection protection)
 events_json = events_json.replace('</script>', '<\\/script>')
 
@@ -101,13 +145,18 @@ new_init = """    init() {
         } else {
             setTimeout(parseData, 0);
         }
-    }
-"""
+    }"""
 
 # Replace the init method - find the entire method body
 # Look for "init() {" and find the matching closing brace
 init_start = app_js.find('init() {')
-if init_start == -1:
+if init_start != -1:
+    # Replace from the start of the line: new_init carries its own indentation,
+    # so keeping the old one would indent init() further on every run
+    line_start = app_js.rfind('\n', 0, init_start) + 1
+    if not app_js[line_start:init_start].strip():
+        init_start = line_start
+else:
     # Try with whitespace
     init_start = app_js.find('init()')
     if init_start != -1:
@@ -117,21 +166,26 @@ if init_start == -1:
             init_start = brace_start
 
 if init_start != -1:
-    # Find the matching closing brace
+    # Find the matching closing brace, jumping straight from one brace to the next
     brace_count = 0
-    i = init_start
-    while i < len(app_js):
-        if app_js[i] == '{':
+    init_end = -1
+    next_open = app_js.find('{', init_start)
+    next_close = app_js.find('}', init_start)
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
             brace_count += 1
-        elif app_js[i] == '}':
+            next_open = app_js.find('{', next_open + 1)
+        else:
             brace_count -= 1
             if brace_count == 0:
                 # Found the matching closing brace
-                init_end = i + 1
-                # Replace the entire method
-                app_js_embedded = app_js[:init_start] + new_init + app_js[init_end:]
+                init_end = next_close + 1
                 break
-        i += 1
+            next_close = app_js.find('}', next_close + 1)
+    
+    if init_end != -1:
+        # Replace the entire method
+        app_js_embedded = app_js[:init_start] + new_init + app_js[init_end:]
     else:
         print("Warning: Could not find matching closing brace for init() method")
         app_js_embedded = app_js
@@ -140,10 +194,8 @@ else:
     app_js_embedded = app_js
 
 # Save as app.js (overwrite existing)
-with open('app.js', 'w', encoding='utf-8') as f:
-    f.write(app_js_embedded)
-
-print(f"Created app.js ({len(app_js_embedded)} bytes)")
+if write_file_if_changed('app.js', app_js_embedded.encode('utf-8')):
+    print(f"Created app.js ({len(app_js_embedded)} bytes)")
 
 # Create single-file standalone version
 print("\nCreating single-file standalone version...")
@@ -224,17 +276,22 @@ html_template = """<!DOCTYPE html>
 </body>
 </html>"""
 
+# Split the template at its placeholders and join the encoded pieces directly,
+# instead of formatting one multi-MB string and then encoding it again
+html_head, _, html_rest = html_template.partition('{css}')
+html_mid1, _, html_rest = html_rest.partition('{events_json}')
+html_mid2, _, html_tail = html_rest.partition('{js}')
+
 # Create standalone HTML
-standalone_html = html_template.format(
-    css=css_content,
-    events_json=events_json,
-    js=app_js_embedded
-)
+standalone_payload = b''.join(part.encode('utf-8') for part in (
+    html_head, css_content, html_mid1, events_json, html_mid2, app_js_embedded, html_tail
+))
 
 # Save standalone version
-with open('index.html', 'w', encoding='utf-8') as f:
-    f.write(standalone_html)
-
-print(f"Created index.html ({len(standalone_html)} bytes)")
+if write_file_if_changed('index.html', standalone_payload) or not os.path.exists('index.html.gz'):
+    # Pre-compressed copy for static hosts that serve .gz siblings (e.g. nginx gzip_static)
+    write_file_atomic('index.html.gz', gzip.compress(standalone_payload, compresslevel=9, mtime=0))
+    print(f"Created index.html ({len(standalone_payload)} bytes, "
+          f"{os.path.getsize('index.html.gz')} bytes gzipped)")
 print("\nSingle-file version ready! Open index.html in your browser.")
 print("Everything is embedded - no external files needed!")
@@ -3,64 +3,199 @@
 FOSDEM Events Data Fetcher (Python version)
  
 This script fetches events from FOSDEM 2026 and saves them as JSON.
-Run: python fetch-events.py
+Run: python fetch-events.py [--pretty] [--refresh]
+
+events.json is written compactly; pass --pretty to indent it for inspection.
+Event metadata is cached in .event_cache.json.gz so re-runs only fetch new
+events; pass --refresh to fetch metadata for all events again.
 
 No dependencies required - uses only standard library.
+If orjson is installed it is used for faster JSON serialization.
 """
 
-import urllib.request
 import urllib.parse
+from html import unescape
+import argparse
+import bisect
+import gzip
+import http.client
 import json
+import logging
+import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 URL = 'https://fosdem.org/2026/schedule/events/'
 
+# Metadata fetching is network-bound, so overlap the requests in a thread pool
+MAX_WORKERS = 16
+REQUEST_INTERVAL = 0.05  # Minimum seconds between request starts - be nice to the server
+USER_AGENT = 'fosdem-event-browser/1.0'
+HTTP_TIMEOUT = 10  # Seconds
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.3  # Seconds, doubled after every failed attempt
+HTTP_REDIRECTS = 5
+CACHE_PATH = '.event_cache.json.gz'
+PROGRESS_INTERVAL = 1.0  # Seconds between progress updates
+
+# Patterns for the listing page. They work on the raw bytes so the whole page never
+# has to be decoded; only the captured groups are decoded to str.
+# Event links - the structure is: <a href="...">TITLE<br/><i></i></a>
+# Captures the event id and everything between > and < (before any <br/> or </a>)
+EVENT_TITLE_RE = re.compile(
+    rb'<a[^>]*href=["\']/2026/schedule/event/([^/"\'>\s]+)/?["\'][^>]*>([^<]+)',
+    re.IGNORECASE
+)
+
+# Speaker, room and day links inside an event's table row, matched in a single pass
+ROW_LINK_RE = re.compile(
+    rb'<a[^>]*href=["\']/2026/schedule/(speaker|room|day)/([^"\']+)["\'][^>]*>([^<]+)</a>',
+    re.IGNORECASE
+)
+TIME_RE = re.compile(rb'\d{1,2}:\d{2}')
+
+# Patterns for the event detail pages, compiled once and reused for every event
+ABSTRACT_RE = re.compile(r'<div class="event-abstract">.*?<p>(.*?)</p>', re.DOTALL | re.IGNORECASE)
+DESCRIPTION_RE = re.compile(r'<div class="event-description">(.*?)</div>', re.DOTALL | re.IGNORECASE)
+VIDEO_RE = re.compile(r'<a[^>]*href=["\'](https://live\.fosdem\.org[^"\']+)["\'][^>]*>', re.IGNORECASE)
+CHAT_RE = re.compile(r'<a[^>]*href=["\'](https://chat\.fosdem\.org[^"\']+)["\'][^>]*>', re.IGNORECASE)
+FAVICON_32_RE = re.compile(
+    r'<link[^>]*rel=["\']icon["\'][^>]*href=["\']([^"\']*favicon-32x32\.png[^"\']*)["\']',
+    re.IGNORECASE
+)
+FAVICON_16_RE = re.compile(
+    r'<link[^>]*rel=["\']icon["\'][^>]*href=["\']([^"\']*favicon-16x16\.png[^"\']*)["\']',
+    re.IGNORECASE
+)
+APPLE_ICON_RE = re.compile(
+    r'<link[^>]*rel=["\']apple-touch-icon["\'][^>]*href=["\']([^"\']+)["\']',
+    re.IGNORECASE
+)
+TAG_STRIP_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+
+def json_loads(text):
+    """Parse a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def json_dumps(obj, indent=False):
+    """Serialize obj to UTF-8 encoded JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    return text.encode('utf-8')
+
+def write_file_atomic(path, payload):
+    """Write bytes to path via a temporary file, so a crash never leaves it half-written"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+# One keep-alive connection per thread and host, so the TLS handshake is only paid once
+_http_local = threading.local()
+
+def get_connection(scheme, host):
+    """Return this thread's persistent connection to host, creating it on first use"""
+    connections = getattr(_http_local, 'connections', None)
+    if connections is None:
+        connections = _http_local.connections = {}
+    conn = connections.get((scheme, host))
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        conn = connections[(scheme, host)] = conn_class(host, timeout=HTTP_TIMEOUT)
+    return conn
+
+def http_get(url, redirects=HTTP_REDIRECTS):
+    """GET url over a reused connection with gzip compression, return the body as bytes"""
+    parts = urllib.parse.urlsplit(url)
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+    headers = {'Accept-Encoding': 'gzip', 'User-Agent': USER_AGENT}
+    
+    conn = get_connection(parts.scheme, parts.netloc)
+    for attempt in range(HTTP_RETRIES):
+        try:
+            conn.request('GET', target, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            break
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive or network hiccup: reconnect (happens automatically) and retry
+            conn.close()
+            if attempt == HTTP_RETRIES - 1:
+                raise
+            time.sleep(HTTP_BACKOFF * 2 ** attempt)
+    if response.will_close:
+        conn.close()
+    
+    if response.status in (301, 302, 303, 307, 308) and redirects > 0:
+        location = urllib.parse.urljoin(url, response.getheader('Location', ''))
+        return http_get(location, redirects - 1)
+    if response.status != 200:
+        raise http.client.HTTPException(f'HTTP {response.status} {response.reason} for {url}')
+    if response.getheader('Content-Encoding', '').lower() == 'gzip':
+        body = gzip.decompress(body)
+    return body
+
+parser = argparse.ArgumentParser(description='Fetch FOSDEM 2026 events and save them to events.json')
+parser.add_argument('--pretty', action='store_true', help='indent events.json for human inspection')
+parser.add_argument('--refresh', action='store_true', help='ignore cached metadata and fetch it for all events')
+args = parser.parse_args()
+
+# Progress and worker-thread warnings go through logging, which is thread-safe
+logging.basicConfig(level=logging.INFO, format='  %(asctime)s %(message)s', datefmt='%H:%M:%S')
+log = logging.getLogger('fetch-events')
+
 print('Fetching FOSDEM 2026 events...')
 
 try:
-    with urllib.request.urlopen(URL) as response:
-        html = response.read().decode('utf-8')
-    print(f'Fetched {len(html)} characters of HTML')
+    html = http_get(URL)
+    print(f'Fetched {len(html)} bytes of HTML')
     # Debug: check if we got the expected content
-    if '/schedule/event/' in html:
+    if b'/schedule/event/' in html:
         print('Found event links in HTML')
     else:
         print('WARNING: No event links found in HTML. Page structure may be different.')
         # Save a sample for debugging
-        with open('debug_html_sample.html', 'w', encoding='utf-8') as f:
-            f.write(html[:5000])  # First 5000 chars
-        print('Saved first 5000 chars to debug_html_sample.html for inspection')
+        with open('debug_html_sample.html', 'wb') as f:
+            f.write(html[:5000])  # First 5000 bytes
+        print('Saved first 5000 bytes to debug_html_sample.html for inspection')
 except Exception as e:
     print(f'Error fetching data: {e}')
     exit(1)
 
 def parse_events_from_html(html_content):
-    """Parse events from FOSDEM HTML table - more flexible approach"""
-    events = []
+    """Parse events from FOSDEM HTML table (raw UTF-8 bytes) - more flexible approach
+
+    Generator: yields each event as soon as it is parsed, so the caller can start
+    fetching its metadata while the rest of the page is still being parsed.
+    Event ids come from the de-duplicated URL list, so each event is yielded once.
+    """
+    failures = 0
     
     # More flexible regex patterns to handle various HTML formats
     # First find event URLs, then extract title from surrounding context
-    event_url_pattern = re.compile(r'/2026/schedule/event/([^/"\'>\s]+)')
-    speaker_pattern = re.compile(
-        r'<a[^>]*href=["\']/2026/schedule/speaker/([^"\']+)["\'][^>]*>([^<]+)</a>',
-        re.IGNORECASE
-    )
-    room_pattern = re.compile(
-        r'<a[^>]*href=["\']/2026/schedule/room/([^"\']+)["\'][^>]*>([^<]+)</a>',
-        re.IGNORECASE
-    )
-    day_pattern = re.compile(
-        r'<a[^>]*href=["\']/2026/schedule/day/([^"\']+)["\'][^>]*>([^<]+)</a>',
-        re.IGNORECASE
-    )
-    time_pattern = re.compile(r'(\d{1,2}:\d{2})')
+    event_url_pattern = re.compile(rb'/2026/schedule/event/([^/"\'>\s]+)')
     
     # Find all track/theme headers (e.g., <h4>AI Plumbers (23)</h4>)
-    track_header_pattern = re.compile(r'<h4>([^<]+) \((\d+)\)</h4>')
+    track_header_pattern = re.compile(rb'<h4>([^<]+) \((\d+)\)</h4>')
     track_headers = []
     for match in track_header_pattern.finditer(html_content):
-        track_name = match.group(1).strip()
+        track_name = match.group(1).decode('utf-8').strip()
         track_count = int(match.group(2))
         track_headers.append({
             'name': track_name,
@@ -70,96 +205,85 @@ def parse_events_from_html(html_content):
     
     print(f'Found {len(track_headers)} track/theme groupings')
     
+    # Sorted offsets of headers and table rows, so each event can look up its
+    # enclosing track and row with a binary search instead of rescanning the HTML
+    track_positions = [track_header['position'] for track_header in track_headers]
+    row_starts = [match.start() for match in re.finditer(rb'<tr\b', html_content)]
+    row_ends = [match.start() for match in re.finditer(rb'</tr>', html_content)]
+    
     # Find all event URLs
-    event_urls = event_url_pattern.findall(html_content)
+    event_urls = [url.decode('utf-8') for url in event_url_pattern.findall(html_content)]
     print(f'Found {len(event_urls)} event URLs in HTML...')
     
     # Remove duplicates while preserving order
-    seen_urls = set()
-    unique_urls = []
-    for url in event_urls:
-        if url not in seen_urls:
-            seen_urls.add(url)
-            unique_urls.append(url)
+    unique_urls = list(dict.fromkeys(event_urls))
     
     print(f'Processing {len(unique_urls)} unique events...')
     
+    # Collect the first titled link for every event in a single pass over the HTML
+    title_by_id = {}
+    title_pos_by_id = {}
+    for title_match in EVENT_TITLE_RE.finditer(html_content):
+        event_id = title_match.group(1).decode('utf-8')
+        if event_id not in title_by_id:
+            title_by_id[event_id] = title_match.group(2).decode('utf-8').strip()
+            title_pos_by_id[event_id] = title_match.start()
+    
     for event_id in unique_urls:
         try:
             event_link = event_id.rstrip('/')
-            # Find the title - the structure is: <a href="...">TITLE<br/><i></i></a>
-            # Extract everything between > and < (before any <br/> or </a>)
-            title_pattern = re.compile(
-                rf'<a[^>]*href=["\']/2026/schedule/event/{re.escape(event_id)}/?["\'][^>]*>([^<]+)',
-                re.IGNORECASE
-            )
-            title_match = title_pattern.search(html_content)
-            if not title_match:
+            title = title_by_id.get(event_id)
+            if title is None:
                 continue
             
-            title = title_match.group(1).strip()
-            
             # Find the table row containing this event (look for surrounding <tr> tags)
-            match_pos = title_match.start()
+            match_pos = title_pos_by_id[event_id]
             
             # Find the most recent track header before this event
             track = None
-            for track_header in reversed(track_headers):
-                if track_header['position'] < match_pos:
-                    track = track_header['name']
-                    break
+            track_index = bisect.bisect_left(track_positions, match_pos)
+            if track_index > 0:
+                track = track_headers[track_index - 1]['name']
             
-            # Find the start of the row
-            row_start = html_content.rfind('<tr', 0, match_pos)
-            if row_start == -1:
+            # Find the start of the row (last <tr before the event link)
+            row_index = bisect.bisect_left(row_starts, match_pos)
+            if row_index == 0:
                 continue
+            row_start = row_starts[row_index - 1]
             
-            # Find the end of the row
-            row_end = html_content.find('</tr>', match_pos)
-            if row_end == -1:
+            # Find the end of the row (first </tr> after the event link)
+            row_index = bisect.bisect_left(row_ends, match_pos)
+            if row_index == len(row_ends):
                 continue
+            row_end = row_ends[row_index]
             
             # Extract the row HTML
             row_html = html_content[row_start:row_end + 5]
             
-            # Extract speakers from this row
+            # Extract speakers (all of them), room and day (first of each) from this row
             speakers = []
-            for speaker_match in speaker_pattern.finditer(row_html):
-                speakers.append({
-                    'id': urllib.parse.unquote(speaker_match.group(1)),
-                    'name': speaker_match.group(2).strip()
-                })
-            
-            # Extract room
             room = None
-            room_match = room_pattern.search(row_html)
-            if room_match:
-                room = {
-                    'id': urllib.parse.unquote(room_match.group(1)),
-                    'name': room_match.group(2).strip()
-                }
-            
-            # Extract day
             day = None
-            day_match = day_pattern.search(row_html)
-            if day_match:
-                day = {
-                    'id': urllib.parse.unquote(day_match.group(1)),
-                    'name': day_match.group(2).strip()
+            for link_match in ROW_LINK_RE.finditer(row_html):
+                kind = link_match.group(1).lower()
+                link = {
+                    'id': urllib.parse.unquote(link_match.group(2).decode('utf-8')),
+                    'name': link_match.group(3).decode('utf-8').strip()
                 }
+                if kind == b'speaker':
+                    speakers.append(link)
+                elif kind == b'room':
+                    if room is None:
+                        room = link
+                elif day is None:
+                    day = link
             
             # Extract times from the row
-            time_matches = list(time_pattern.finditer(row_html))
-            start_time = ''
-            end_time = ''
-            
-            if len(time_matches) >= 2:
-                start_time = time_matches[0].group(1)
-                end_time = time_matches[1].group(1)
-            elif len(time_matches) == 1:
-                start_time = time_matches[0].group(1)
+            times = TIME_RE.findall(row_html)
+            start_time = times[0].decode('ascii') if times else ''
+            end_time = times[1].decode('ascii') if len(times) > 1 else ''
             
-            events.append({
+            yield {
                 'id': event_id,
                 'title': title,
                 'link': f'https://fosdem.org/2026/schedule/event/{event_link}/',
@@ -169,105 +293,76 @@ def parse_events_from_html(html_content):
                 'startTime': start_time,
                 'endTime': end_time,
                 'track': track
-            })
+            }
         except Exception as e:
             # Skip events that fail to parse (only show first few errors)
-            if len([ev for ev in events if ev]) < 5:
+            failures += 1
+            if failures <= 5:
                 print(f'Warning: Failed to parse event {event_id}: {e}')
             continue
-    
-    # Remove duplicates
-    seen_ids = set()
-    unique_events = []
-    for event in events:
-        if event['id'] not in seen_ids:
-            seen_ids.add(event['id'])
-            unique_events.append(event)
-    
-    print(f'Parsed {len(unique_events)} unique events')
-    return unique_events
 
-def fetch_event_metadata(event_link, delay=0.1):
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+def wait_for_request_slot():
+    """Block until the next request may start (rate limit shared by all worker threads)"""
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+def html_to_text(fragment):
+    """Convert an HTML fragment to plain text: drop tags, decode entities, collapse whitespace"""
+    text = unescape(TAG_STRIP_RE.sub('', fragment))
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+def fetch_event_metadata(event_link):
     """Fetch abstract and description from an event's detail page"""
     try:
-        time.sleep(delay)  # Rate limiting - be nice to the server
-        with urllib.request.urlopen(event_link) as response:
-            html = response.read().decode('utf-8')
+        wait_for_request_slot()
+        html = http_get(event_link).decode('utf-8')
         
         # Extract abstract
         abstract = None
-        abstract_match = re.search(
-            r'<div class="event-abstract">.*?<p>(.*?)</p>',
-            html,
-            re.DOTALL | re.IGNORECASE
-        )
+        abstract_match = ABSTRACT_RE.search(html)
         if abstract_match:
-            abstract = re.sub(r'<[^>]+>', '', abstract_match.group(1)).strip()
-            # Clean up whitespace
-            abstract = ' '.join(abstract.split())
-            if abstract:
-                abstract = abstract[:500]  # Limit length
+            abstract = html_to_text(abstract_match.group(1))[:500]  # Limit length
         
         # Extract description (if present)
         description = None
-        description_match = re.search(
-            r'<div class="event-description">(.*?)</div>',
-            html,
-            re.DOTALL | re.IGNORECASE
-        )
+        description_match = DESCRIPTION_RE.search(html)
         if description_match:
             desc_html = description_match.group(1).strip()
             if desc_html:
-                # Remove HTML tags and clean up
-                description = re.sub(r'<[^>]+>', '', desc_html).strip()
-                description = ' '.join(description.split())
-                if description:
-                    description = description[:500]  # Limit length
+                description = html_to_text(desc_html)[:500]  # Limit length
         
         # Extract video link
         video_link = None
-        video_match = re.search(
-            r'<a[^>]*href=["\'](https://live\.fosdem\.org[^"\']+)["\'][^>]*>',
-            html,
-            re.IGNORECASE
-        )
+        video_match = VIDEO_RE.search(html)
         if video_match:
             video_link = video_match.group(1)
         
         # Extract chat link
         chat_link = None
-        chat_match = re.search(
-            r'<a[^>]*href=["\'](https://chat\.fosdem\.org[^"\']+)["\'][^>]*>',
-            html,
-            re.IGNORECASE
-        )
+        chat_match = CHAT_RE.search(html)
         if chat_match:
             chat_link = chat_match.group(1)
         
         # Extract navicon (favicon)
         navicon = None
         # Try to find favicon-32x32.png first, then favicon-16x16.png, then apple-touch-icon
-        favicon_32 = re.search(
-            r'<link[^>]*rel=["\']icon["\'][^>]*href=["\']([^"\']*favicon-32x32\.png[^"\']*)["\']',
-            html,
-            re.IGNORECASE
-        )
+        favicon_32 = FAVICON_32_RE.search(html)
         if favicon_32:
             navicon = favicon_32.group(1)
         else:
-            favicon_16 = re.search(
-                r'<link[^>]*rel=["\']icon["\'][^>]*href=["\']([^"\']*favicon-16x16\.png[^"\']*)["\']',
-                html,
-                re.IGNORECASE
-            )
+            favicon_16 = FAVICON_16_RE.search(html)
             if favicon_16:
                 navicon = favicon_16.group(1)
             else:
-                apple_icon = re.search(
-                    r'<link[^>]*rel=["\']apple-touch-icon["\'][^>]*href=["\']([^"\']+)["\']',
-                    html,
-                    re.IGNORECASE
-                )
+                apple_icon = APPLE_ICON_RE.search(html)
                 if apple_icon:
                     navicon = apple_icon.group(1)
         
@@ -283,7 +378,7 @@ def fetch_event_metadata(event_link, delay=0.1):
             'navicon': navicon
         }
     except Exception as e:
-        print(f'  Warning: Could not fetch metadata for {event_link}: {e}')
+        log.warning('Warning: Could not fetch metadata for %s: %s', event_link, e)
         return {
             'abstract': None,
             'description': None,
@@ -292,29 +387,68 @@ def fetch_event_metadata(event_link, delay=0.1):
             'navicon': None
         }
 
+def load_metadata_cache():
+    """Load per-event metadata (keyed by event id) saved by previous runs"""
+    if not os.path.exists(CACHE_PATH):
+        return {}
+    try:
+        with gzip.open(CACHE_PATH, 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, ValueError) as e:
+        print(f'Warning: Ignoring unreadable metadata cache {CACHE_PATH}: {e}')
+        return {}
+
+def save_metadata_cache(cache):
+    """Write the metadata cache atomically so an interrupted run cannot corrupt it"""
+    write_file_atomic(CACHE_PATH, gzip.compress(json_dumps(cache)))
+
 try:
-    events = parse_events_from_html(html)
-    
-    # Optionally fetch metadata for each event (can be slow for 1000+ events)
-    print(f'\nFetching metadata (abstracts/descriptions) for {len(events)} events...')
-    print('This may take a while. Press Ctrl+C to skip and use basic data only.')
+    # Reuse metadata from previous runs, only events not seen before are fetched
+    cache = {} if args.refresh else load_metadata_cache()
     
+    events = []
+    futures = {}
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
     try:
-        for i, event in enumerate(events, 1):
-            if i % 10 == 0:
-                print(f'  Progress: {i}/{len(events)} events...')
-            
-            metadata = fetch_event_metadata(event['link'])
-            event['abstract'] = metadata['abstract']
-            event['description'] = metadata['description']
-            event['videoLink'] = metadata['videoLink']
-            event['chatLink'] = metadata['chatLink']
-            event['navicon'] = metadata['navicon']
-    except KeyboardInterrupt:
-        print('\n  Interrupted by user. Continuing with available data...')
-    except Exception as e:
-        print(f'\n  Error fetching metadata: {e}')
-        print('  Continuing with basic event data...')
+        # Metadata requests are queued as soon as each event is parsed, so parsing
+        # the rest of the page overlaps with the first network round trips
+        for event in parse_events_from_html(html):
+            events.append(event)
+            metadata = cache.get(event['id'])
+            if metadata is None:
+                futures[executor.submit(fetch_event_metadata, event['link'])] = event
+            else:
+                event.update(metadata)
+        print(f'Parsed {len(events)} unique events')
+        
+        # Optionally fetch metadata for each event (can be slow for 1000+ events)
+        print(f'\nFetching metadata (abstracts/descriptions) for {len(futures)} events '
+              f'({len(events) - len(futures)} cached)...')
+        print('This may take a while. Press Ctrl+C to skip and use basic data only.')
+        
+        try:
+            last_progress = time.monotonic()
+            for i, future in enumerate(as_completed(futures), 1):
+                now = time.monotonic()
+                if now - last_progress >= PROGRESS_INTERVAL or i == len(futures):
+                    log.info('Progress: %d/%d events...', i, len(futures))
+                    last_progress = now
+                
+                event = futures[future]
+                metadata = future.result()
+                event.update(metadata)
+                # All-None metadata means the fetch failed, so retry it next run
+                if any(metadata.values()):
+                    cache[event['id']] = metadata
+        except KeyboardInterrupt:
+            print('\n  Interrupted by user. Continuing with available data...')
+        except Exception as e:
+            print(f'\n  Error fetching metadata: {e}')
+            print('  Continuing with basic event data...')
+    finally:
+        # Drop queued requests; only the ones already in flight are left to finish
+        executor.shutdown(wait=False, cancel_futures=True)
+        save_metadata_cache(cache)
     
     # Save to JSON file with metadata
     from datetime import datetime
@@ -322,8 +456,10 @@ try:
         'scrapedAt': datetime.now().isoformat(),
         'events': events
     }
-    with open('events.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    payload = json_dumps(data, indent=args.pretty)
+    write_file_atomic('events.json', payload)
+    # Pre-compressed copy for static hosts that serve .gz siblings (e.g. nginx gzip_static)
+    write_file_atomic('events.json.gz', gzip.compress(payload, compresslevel=9, mtime=0))
     
     events_with_abstract = sum(1 for e in events if e.get('abstract'))
     print(f'\nSuccessfully saved {len(events)} events to events.json')